@@ -14,9 +14,16 @@ import asyncio
 import logging
 import os
 from collections import namedtuple
-from hashlib import sha1
+from hashlib import blake2b
 from urllib.parse import urlparse
 
+try:
+    # OpenSSL's SHA-1 dispatches to hardware instructions (SHA-NI) when the
+    # CPU supports them, so prefer it over any pure-Python fallback.
+    from _hashlib import openssl_sha1 as sha1
+except ImportError:
+    from hashlib import sha1
+
 import discord
 
 from futaba.download import download_links
@@ -29,6 +36,12 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["FoundFileViolation", "check_file_filter"]
 
+# Severity thresholds, bound once since FilterType.level is a property
+# that re-evaluates on every access
+_FLAG_LEVEL = FilterType.FLAG.level
+_BLOCK_LEVEL = FilterType.BLOCK.level
+_JAIL_LEVEL = FilterType.JAIL.level
+
 
 FoundFileViolation = namedtuple(
     "FoundFileViolation",
@@ -36,28 +49,83 @@ FoundFileViolation = namedtuple(
 )
 
 
+class _ContentHasher:
+    """
+    Hashes a stream with both content fingerprint algorithms: BLAKE2b,
+    which is faster and not cryptographically broken, and the legacy SHA-1,
+    which is kept so existing filter entries still match during the
+    transition. Both digests are 20 bytes, so either may be added to the
+    content filter.
+    """
+
+    __slots__ = ("_blake2b", "_sha1")
+
+    def __init__(self):
+        self._blake2b = blake2b(digest_size=20)
+        self._sha1 = sha1()
+
+    def update(self, chunk):
+        self._blake2b.update(chunk)
+        self._sha1.update(chunk)
+
+    def digest(self):
+        """ Returns both digests, preferred algorithm first. """
+
+        return (self._blake2b.digest(), self._sha1.digest())
+
+
 async def check_file_filter(cog, message):
-    file_urls = URL_REGEX.findall(message.content)
-    file_urls.extend(attach.url for attach in message.attachments)
+    # Every match starts with "http", so a substring check skips the much
+    # more expensive regex scan for the common message without links
+    if "http" in message.content:
+        urls = URL_REGEX.findall(message.content)
+    else:
+        urls = []
+
+    # Use a dict to preserve order while collapsing duplicate URLs,
+    # so repeated links are only downloaded and hashed once
+    file_urls = list(
+        dict.fromkeys(urls + [attach.url for attach in message.attachments])
+    )
 
     if not file_urls:
         return
 
+    filters = cog.content_filters[message.guild]
+    if not filters:
+        # No content filters configured, skip downloading and hashing
+        return
+
+    # Skip URLs whose content was hashed recently and matched no filter.
+    # Matching URLs are downloaded again so the file is available for reupload.
+    fetch_urls = []
+    for url in file_urls:
+        digests = cog.url_hash_cache.get(url)
+        if digests is None or any(digest in filters for digest in digests):
+            fetch_urls.append(url)
+
+    if not fetch_urls:
+        return
+
     triggered = None
-    buffers = await download_links(file_urls)
+    results = await download_links(fetch_urls, hasher=_ContentHasher)
     hashsums = {}
 
-    for binio, url in zip(buffers, file_urls):
-        if binio is not None:
-            digest = sha1(binio.getbuffer()).digest()
-            hashsums[digest] = (binio, url)
+    for result, url in zip(results, fetch_urls):
+        if result is not None:
+            binio, digests = result
+            for digest in digests:
+                hashsums[digest] = (binio, url)
+            cog.url_hash_cache[url] = digests
 
-    for hashsum, (filter_type, _) in cog.content_filters[message.guild].items():
-        try:
-            binio, url = hashsums[hashsum]
-        except KeyError:
-            # Hash sum not found, not a match
-            continue
+    matches = hashsums.keys() & filters.keys()
+    if not matches:
+        # None of the downloaded files match any filter, the common case
+        return
+
+    for hashsum in matches:
+        binio, url = hashsums[hashsum]
+        filter_type, _ = filters[hashsum]
 
         if triggered is None or filter_type.value > triggered.filter_type.value:
             triggered = FoundFileViolation(
@@ -70,6 +138,10 @@ async def check_file_filter(cog, message):
                 hashsum=hashsum,
             )
 
+            if filter_type.level >= _JAIL_LEVEL:
+                # No higher severity can override this match
+                break
+
     if triggered is not None:
         settings = cog.bot.sql.filter.get_settings(message.guild)
         await found_file_violation(triggered, settings.reupload)
@@ -87,7 +159,6 @@ async def found_file_violation(triggered, reupload):
     filter_type = triggered.filter_type
     url = triggered.url
     binio = triggered.binio
-    hashsum = triggered.hashsum
     hexsum = triggered.hashsum.hex()
 
     logger.info(
@@ -108,14 +179,14 @@ async def found_file_violation(triggered, reupload):
             f"The message you posted in {message.channel.mention} contains or links to a file "
         )
         response.writeln(
-            f"that violates a {filter_type.value} content filter: `{hashsum.hex()}`."
+            f"that violates a {filter_type.value} content filter: `{hexsum}`."
         )
         response.writeln(f"Your original link: <{url}>")
 
         if reupload:
             response.writeln("The filtered file has been attached to this message.")
 
-        if severity >= FilterType.JAIL.level:
+        if severity >= _JAIL_LEVEL:
             if roles.jail is not None:
                 response.writeln(
                     "This offense is serious enough to warrant immediate revocation of posting privileges.\n"
@@ -128,22 +199,24 @@ async def found_file_violation(triggered, reupload):
                 "In case the link is broken, the file has been attached below:"
             )
             filename = os.path.basename(urlparse(url).path)
-            kwargs["file"] = discord.File(binio.getbuffer(), filename=filename)
+            # Reuse the downloaded buffer directly instead of copying it
+            binio.seek(0)
+            kwargs["file"] = discord.File(binio, filename=filename)
 
         kwargs["content"] = str(response)
         await message.author.send(**kwargs)
 
-    if severity >= FilterType.FLAG.level:
+    if severity >= _FLAG_LEVEL:
         logger.info("Notifying staff of filter violation")
         journal_violation(journal, "file", message, filter_type, hexsum, url)
 
-    if severity >= FilterType.BLOCK.level:
+    if severity >= _BLOCK_LEVEL:
         logger.info(
             "Deleting inappropriate message id %d and notifying user", message.id
         )
         await asyncio.gather(message.delete(), message_violator())
 
-    if severity >= FilterType.JAIL.level:
+    if severity >= _JAIL_LEVEL:
         if roles.jail is None:
             logger.info(
                 "Jailing user for inappropriate file, except there is no jail role configured!"
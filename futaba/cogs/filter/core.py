@@ -24,6 +24,7 @@ from discord.ext import commands
 from futaba import permissions
 from futaba.enums import FilterType
 from futaba.exceptions import CommandFailed, ManualCheckFailure, SendHelp
+from futaba.lru import LruCache
 from futaba.permissions import admin_perm
 from futaba.utils import async_partial, escape_backticks
 from .check import (
@@ -52,6 +53,7 @@ class Filtering(AbstractCog):
         "journal",
         "filters",
         "content_filters",
+        "url_hash_cache",
         "check_message",
         "check_message_edit",
         "check_member_join",
@@ -63,6 +65,7 @@ class Filtering(AbstractCog):
         self.journal = bot.get_broadcaster("/filter")
         self.filters = defaultdict(dict)
         self.content_filters = defaultdict(dict)
+        self.url_hash_cache = LruCache(4096)
         self.check_message = async_partial(check_message, self)
         self.check_message_edit = async_partial(check_message_edit, self)
         self.check_member_join = async_partial(check_member_join, self)
@@ -117,7 +120,8 @@ class Filtering(AbstractCog):
     @commands.guild_only()
     async def ffilter(self, ctx):
         """
-        Adds, removes, or lists SHA1 hashes in the content filter.
+        Adds, removes, or lists hashes in the content filter.
+        Both BLAKE2b (20-byte) and legacy SHA1 hashes are matched.
         """
 
         if ctx.invoked_subcommand is None:
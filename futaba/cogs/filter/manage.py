@@ -136,7 +136,7 @@ async def check_hashsums(*hashsums):
         raise CommandFailed()
 
     if not all(map(lambda h: len(h) == 40 and HEXADECIMAL_REGEX.match(h), hashsums)):
-        raise CommandFailed(content="SHA1 hashes are 40 hex digits long.")
+        raise CommandFailed(content="Content hashes are 40 hex digits long.")
 
 
 async def add_content_filter(bot, guild, filters, level, hexsum, description):
@@ -50,27 +50,26 @@ class Journal(AbstractCog):
     def setup(self):
         logger.info("Loading journal output channels from the database")
         with self.bot.sql.transaction():
-            for guild in self.bot.guilds:
-                for output in self.bot.sql.journal.fetch_journal_channels(guild):
-                    logger.info(
-                        "Registering journal channel #%s (%d) for path '%s'",
-                        output.sink.name,
-                        output.sink.id,
-                        output.path,
-                    )
-                    self.router.register(
-                        ChannelOutputListener(self.router, output.path, output.sink)
-                    )
-                for output in self.bot.sql.journal.fetch_journal_users(self.bot, guild):
-                    logger.info(
-                        "Registering journal DM on user '%s' (%d) for path '%s'",
-                        output.sink.name,
-                        output.sink.id,
-                        output.path,
-                    )
-                    self.router.register(
-                        DirectMessageListener(self.router, output.path, output.sink)
-                    )
+            for output in self.bot.sql.journal.fetch_journal_channels(self.bot):
+                logger.info(
+                    "Registering journal channel #%s (%d) for path '%s'",
+                    output.sink.name,
+                    output.sink.id,
+                    output.path,
+                )
+                self.router.register(
+                    ChannelOutputListener(self.router, output.path, output.sink)
+                )
+            for output in self.bot.sql.journal.fetch_journal_users(self.bot):
+                logger.info(
+                    "Registering journal DM on user '%s' (%d) for path '%s'",
+                    output.sink.name,
+                    output.sink.id,
+                    output.path,
+                )
+                self.router.register(
+                    DirectMessageListener(self.router, output.path, output.sink)
+                )
         self.router.start(self.bot.loop)
 
     @commands.group(name="journal", aliases=["log"])
@@ -95,20 +94,22 @@ class Journal(AbstractCog):
         outputs = self.bot.sql.journal.get_journals_on_channels(*channels)
         outputs = sorted(outputs, key=lambda out: out.path)
         attributes = []
-        descr = StringBuilder()
+        lines = []
 
         for output in outputs:
             if not output.settings.recursive:
                 attributes.append("exact path")
 
             attr_str = f'({", ".join(attributes)})' if attributes else ""
-            descr.writeln(
+            lines.append(
                 f"- `{output.path}` mounted at {output.sink.mention} {attr_str}"
             )
             attributes.clear()
 
         if outputs:
-            embed = discord.Embed(colour=discord.Colour.teal(), description=str(descr))
+            embed = discord.Embed(
+                colour=discord.Colour.teal(), description="\n".join(lines)
+            )
             embed.set_author(name="Current journal outputs")
         else:
             embed = discord.Embed(colour=discord.Colour.dark_purple())
@@ -448,41 +449,39 @@ class Journal(AbstractCog):
             condition or "(none)",
         )
 
-        def create_scope(event):
-            return {
-                "path": str(event.path),
-                "ppath": event.path,
-                "guild": guild,
-                "content": event.content,
-                "attributes": event.attributes,
-            }
-
         events = reversed(self.journal.history)
         events = filter(lambda evt: evt.guild == guild, events)
         events = islice(events, max_items)
 
         if condition is None:
-            matched = events
-        else:
-            try:
-                compile(condition, "<futaba journal-find eval>", "eval")
-            except Exception as error:
-                logger.info("Error compiling condition", exc_info=error)
-                embed = discord.Embed(colour=discord.Colour.red())
-                embed.set_author(name="Compilation error parsing condition")
-                trace = "\n".join(
-                    traceback.format_exception(type(error), error, error.__traceback__)
-                )
-                embed.description = f"```py\n{trace}\n```"
-                raise CommandFailed(embed=embed)
+            return list(events), []
+
+        # Compile once up front instead of re-parsing the condition per event
+        try:
+            code = compile(condition, "<futaba journal-find eval>", "eval")
+        except Exception as error:
+            logger.info("Error compiling condition", exc_info=error)
+            embed = discord.Embed(colour=discord.Colour.red())
+            embed.set_author(name="Compilation error parsing condition")
+            trace = "\n".join(
+                traceback.format_exception(type(error), error, error.__traceback__)
+            )
+            embed.description = f"```py\n{trace}\n```"
+            raise CommandFailed(embed=embed)
 
         matched = []
         error_embeds = []
+        scope = {"guild": guild}
         for event in tuple(events):
+            scope["path"] = str(event.path)
+            scope["ppath"] = event.path
+            scope["content"] = event.content
+            scope["attributes"] = event.attributes
+
             try:
                 # Limited eval for journal filter evaluation
                 # pylint: disable=eval-used
-                if eval(condition, create_scope(event)):
+                if eval(code, scope):
                     matched.append(event)
             except Exception as error:
                 logger.info("Runtime error while evaluating condition", exc_info=error)
@@ -520,19 +519,25 @@ class Journal(AbstractCog):
         if events:
             embed = discord.Embed(colour=discord.Colour.dark_teal())
             embed.set_author(name="Matching journal events")
-            descr = StringBuilder()
+            lines = []
+            length = 0
 
             embeds = []
             for event in events:
-                descr.writeln(f"Path: `{event.path}`, Content: {event.content}")
-                descr.writeln(f"Attributes: ```py\n{pformat(event.attributes)}\n```\n")
-                if len(descr) > 1400:
-                    embed.description = str(descr)
+                lines.append(f"Path: `{event.path}`, Content: {event.content}")
+                lines.append(f"Attributes: ```py\n{pformat(event.attributes)}\n```\n")
+                length += len(lines[-2]) + len(lines[-1]) + 2
+                if length > 1400:
+                    embed.description = "\n".join(lines)
                     embeds.append(embed)
-                    descr.clear()
+                    lines.clear()
+                    length = 0
                     embed = discord.Embed(colour=discord.Colour.dark_teal())
                     embed.set_author(name="Matched journal events")
-            embed.description = str(descr)
+
+            if lines:
+                embed.description = "\n".join(lines)
+                embeds.append(embed)
         else:
             embed = discord.Embed(colour=discord.Colour.dark_purple())
             embed.set_author(name="No matching journal entries")
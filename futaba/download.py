@@ -25,25 +25,54 @@ __all__ = ["MAXIMUM_FILE_SIZE", "download_links", "download_link"]
 MAXIMUM_FILE_SIZE = 24 * 1024 * 1024
 
 # How large each read request should be
-CHUNK_SIZE = 4 * 1024
+CHUNK_SIZE = 64 * 1024
 
 # Prevent connections from hanging for too long
 TIMEOUT = aiohttp.ClientTimeout(total=45, sock_read=5)
 
+# Shared session, lazily created inside the running event loop
+_SESSION = None
 
-async def download_links(urls):
-    async with aiohttp.ClientSession(timeout=TIMEOUT, trust_env=True) as session:
-        buffers = await asyncio.gather(*[download(session, url) for url in urls])
-    return buffers
 
+def _get_session():
+    """
+    Returns the shared client session, creating it if necessary.
+    Reusing one session pools connections across messages, avoiding
+    repeated connector setup and TLS handshakes per download burst.
+    """
 
-async def download_link(url):
-    async with aiohttp.ClientSession(timeout=TIMEOUT, trust_env=True) as session:
-        return await download(session, url)
+    # pylint: disable=global-statement
+    global _SESSION
 
+    if _SESSION is None or _SESSION.closed:
+        # Cache DNS results so a burst of downloads from the same host
+        # (e.g. the Discord CDN) resolves at most once
+        connector = aiohttp.TCPConnector(ttl_dns_cache=300)
+        _SESSION = aiohttp.ClientSession(
+            connector=connector, timeout=TIMEOUT, trust_env=True
+        )
+    return _SESSION
+
+
+async def download_links(urls, hasher=None):
+    session = _get_session()
+    return await asyncio.gather(*[download(session, url, hasher) for url in urls])
+
+
+async def download_link(url, hasher=None):
+    return await download(_get_session(), url, hasher)
+
+
+async def download(session, url, hasher=None):
+    """
+    Downloads the given URL into a BytesIO, returning None on failure.
+    If a hasher factory is passed, the content is also hashed as it streams
+    in, and (buffer, digest) is returned instead.
+    """
 
-async def download(session, url):
     binio = BytesIO()
+    size = 0
+    hashobj = None if hasher is None else hasher()
     try:
         async with session.get(url) as response:
             if response.content_length is not None:
@@ -55,17 +84,23 @@ async def download(session, url):
                     )
                     return None
 
-            while len(binio.getbuffer()) < MAXIMUM_FILE_SIZE:
-                chunk = await response.content.read(CHUNK_SIZE)
-                if chunk:
-                    binio.write(chunk)
-                else:
-                    return binio
-            logger.info(
-                "File was too large, bailing out (max file size: %d bytes)",
-                MAXIMUM_FILE_SIZE,
-            )
-            return None
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                binio.write(chunk)
+                size += len(chunk)
+                if hashobj is not None:
+                    hashobj.update(chunk)
+
+                if size >= MAXIMUM_FILE_SIZE:
+                    logger.info(
+                        "File was too large, bailing out (max file size: %d bytes)",
+                        MAXIMUM_FILE_SIZE,
+                    )
+                    return None
+
+            if hashobj is None:
+                return binio
+
+            return binio, hashobj.digest()
     except SSLError:
         # Ignore SSL errors
         pass
@@ -264,7 +264,7 @@ class FilterModel:
         return self.immune_users_cache[guild]
 
     def get_filter_immune_users(self, guild):
-        logger.info(
+        logger.debug(
             "Getting users with filter immunity in guild '%s' (%d)",
             guild.name,
             guild.id,
@@ -354,7 +354,7 @@ class FilterModel:
         return storage
 
     def get_settings(self, guild):
-        logger.info(
+        logger.debug(
             "Getting cached filter settings for guild '%s' (%d)", guild.name, guild.id
         )
         return self.settings_cache[guild]
@@ -196,66 +196,68 @@ class JournalModel:
         )
         return path in self.journal_outputs_cache[user]
 
-    def fetch_journal_channels(self, guild):
-        logger.info(
-            "Fetching all journal channel outputs for guild '%s' (%d)",
-            guild.name,
-            guild.id,
-        )
+    def fetch_journal_channels(self, bot):
+        logger.info("Fetching journal channel outputs for all guilds")
 
         sel = select(
             [
+                self.tb_journal_outputs.c.guild_id,
                 self.tb_journal_outputs.c.location_id,
                 self.tb_journal_outputs.c.path,
                 self.tb_journal_outputs.c.recursive,
             ]
-        ).where(
-            and_(
-                self.tb_journal_outputs.c.guild_id == guild.id,
-                self.tb_journal_outputs.c.location_type == LocationType.CHANNEL,
-            )
-        )
+        ).where(self.tb_journal_outputs.c.location_type == LocationType.CHANNEL)
         result = self.sql.execute(sel)
 
-        # Update cache
-        for channel_id, path, recursive in result.fetchall():
+        # Update cache and compile output list
+        outputs = []
+        for guild_id, channel_id, path, recursive in result.fetchall():
+            guild = bot.get_guild(guild_id)
+            if guild is None:
+                # No longer in this guild
+                continue
+
             channel = guild.get_channel(channel_id)
-            self.journal_outputs_cache[channel][path] = JournalOutputData(
-                recursive=recursive
+            if channel is None:
+                # Channel was deleted
+                continue
+
+            settings = JournalOutputData(recursive=recursive)
+            self.journal_outputs_cache[channel][path] = settings
+            outputs.append(
+                ConfiguredJournalOutput(sink=channel, path=path, settings=settings)
             )
+        return outputs
 
-        # Compile guild list
-        return self.get_journals_on_channels(*guild.channels)
-
-    def fetch_journal_users(self, bot, guild):
-        logger.info(
-            "Fetching all journal user outputs in guild '%s' (%d)", guild.name, guild.id
-        )
+    def fetch_journal_users(self, bot):
+        logger.info("Fetching journal user outputs for all guilds")
 
         sel = select(
             [
+                self.tb_journal_outputs.c.guild_id,
                 self.tb_journal_outputs.c.location_id,
                 self.tb_journal_outputs.c.path,
                 self.tb_journal_outputs.c.recursive,
             ]
-        ).where(
-            and_(
-                self.tb_journal_outputs.c.guild_id == guild.id,
-                self.tb_journal_outputs.c.location_type == LocationType.USER,
-            )
-        )
+        ).where(self.tb_journal_outputs.c.location_type == LocationType.USER)
         result = self.sql.execute(sel)
 
-        # Update cache
+        # Update cache and compile user list
         users = []
-        for user_id, path, recursive in result.fetchall():
+        for guild_id, user_id, path, recursive in result.fetchall():
+            if bot.get_guild(guild_id) is None:
+                # No longer in this guild
+                continue
+
             user = bot.get_user(user_id)
-            self.journal_outputs_cache[user][path] = JournalOutputData(
-                recursive=recursive
-            )
-            users.extend(self.get_journals_on_user(user))
+            if user is None:
+                continue
 
-        # Compile user list
+            settings = JournalOutputData(recursive=recursive)
+            self.journal_outputs_cache[user][path] = settings
+            users.append(
+                ConfiguredJournalOutput(sink=user, path=path, settings=settings)
+            )
         return users
 
     def get_journals_on_channels(self, *channels):